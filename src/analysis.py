@@ -119,3 +119,63 @@ def get_season_thresholds(city_df: pd.DataFrame, season: str) -> tuple[float, fl
     )
 
     return lower, upper
+
+
+def get_season_thresholds_table(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Вычисление порогов аномалий по всем городам и сезонам сразу
+
+    Args:
+        data (pd.DataFrame): Исходный датафрейм с температурой для всех городов
+
+    Returns:
+        pd.DataFrame: Датафрейм с колонками city, season, mean, std, lower, upper
+    """
+    thresholds = (
+        data.groupby(["city", "season"])["temperature"]
+        .agg(["mean", "std"])
+        .reset_index()
+    )
+    thresholds["lower"] = thresholds["mean"] - 2 * thresholds["std"]
+    thresholds["upper"] = thresholds["mean"] + 2 * thresholds["std"]
+
+    return thresholds
+
+
+def screen_current_temperatures(
+    temperatures: dict[str, float], thresholds: pd.DataFrame, season: str
+) -> pd.DataFrame:
+    """
+    Проверка текущих температур всех городов на аномальность для текущего сезона.
+    Отклонение считается в стандартных отклонениях от среднего по сезону,
+    города отсортированы по модулю отклонения по убыванию.
+    Города без порогов или с нулевым/неопределённым std остаются в таблице
+    с пустым отклонением и не считаются аномальными
+
+    Args:
+        temperatures (dict[str, float]): Словарь город: текущая температура
+        thresholds (pd.DataFrame): Таблица порогов из get_season_thresholds_table
+        season (str): Название текущего сезона
+
+    Returns:
+        pd.DataFrame: Датафрейм с порогами, отклонением и отметкой аномалии для каждого города
+    """
+    current = pd.DataFrame(
+        list(temperatures.items()), columns=["city", "temperature"]
+    ).astype({"city": str, "temperature": float})
+    season_thresholds = thresholds[thresholds["season"] == season].drop(
+        columns="season"
+    )
+
+    df = current.merge(season_thresholds, on="city", how="left")
+    std = df["std"].where(df["std"] > 0)
+    df["deviation"] = (df["temperature"] - df["mean"]) / std
+    df["is_anomaly"] = df["deviation"].notna() & (
+        (df["temperature"] > df["upper"]) | (df["temperature"] < df["lower"])
+    )
+
+    return (
+        df.sort_values("deviation", key=lambda s: s.abs(), ascending=False)
+        .drop(columns=["mean", "std"])
+        .reset_index(drop=True)
+    )
@@ -1,8 +1,21 @@
+import hashlib
+import os
+import shutil
+import uuid
+
 import modin.pandas as mpd
 import pandas as pd
+import pyarrow.dataset as ds
 import streamlit as st
+from distributed import Client, Future
 
-from analysis import process_city
+from analysis import get_season_thresholds_table, get_year_stats, process_city
+from config import (
+    DASK_DATASET_PATH,
+    DASK_SCHEDULER_ADDRESS,
+    DASK_SHARDS_PATH,
+    SEASON_NAMES,
+)
 from utils import sync_timeit
 
 
@@ -30,6 +43,134 @@ def get_cities_data_parallel(
     return cities_data
 
 
+@st.cache_resource
+def get_dask_client(scheduler_address: str) -> Client:
+    """
+    Подключается к планировщику Dask по адресу
+
+    Args:
+        scheduler_address (str): Адрес планировщика
+
+    Returns:
+        Client: Клиент Dask
+    """
+    return Client(scheduler_address)
+
+
+def get_shards_path(data: pd.DataFrame) -> str:
+    """
+    Возвращает каталог шардов для данных по хэшу их содержимого,
+    чтобы одинаковые загрузки использовали один набор шардов
+
+    Args:
+        data (pd.DataFrame): Исходный датафрейм с температурой
+
+    Returns:
+        str: Путь к каталогу шардов внутри DASK_SHARDS_PATH
+    """
+    row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+    return os.path.join(DASK_SHARDS_PATH, hashlib.sha256(row_hashes).hexdigest())
+
+
+def write_city_shards(data: pd.DataFrame, shards_path: str) -> None:
+    """
+    Сохраняет исходные данные в parquet с разбиением по городам (city=<город>/)
+    Если каталог уже существует, шарды не перезаписываются. Запись идёт во временный
+    каталог с последующим переименованием, поэтому неполный набор шардов не остаётся под итоговым именем
+
+    Args:
+        data (pd.DataFrame): Исходный датафрейм с температурой
+        shards_path (str): Путь к каталогу шардов, доступный всем воркерам
+    """
+    if os.path.exists(shards_path):
+        return
+
+    tmp_path = f"{shards_path}.tmp-{uuid.uuid4().hex}"
+    try:
+        data.to_parquet(tmp_path, partition_cols=["city"], index=False)
+        os.rename(tmp_path, shards_path)
+    except OSError:
+        # те же данные могла параллельно записать другая сессия
+        if not os.path.exists(shards_path):
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def get_shard_cities(shards_path: str) -> list[str]:
+    """
+    Возвращает список городов по именам разделов, не читая сами данные
+
+    Args:
+        shards_path (str): Путь к каталогу шардов
+
+    Returns:
+        list[str]: Отсортированный список городов
+    """
+    dataset = ds.dataset(shards_path, format="parquet", partitioning="hive")
+    return sorted(
+        {
+            ds.get_partition_keys(fragment.partition_expression)["city"]
+            for fragment in dataset.get_fragments()
+        }
+    )
+
+
+def process_city_shard(shards_path: str, city: str) -> pd.DataFrame:
+    """
+    Читает шард конкретного города и обрабатывает его. Выполняется на воркере
+
+    Args:
+        shards_path (str): Путь к каталогу шардов
+        city (str): Название города
+
+    Returns:
+        pd.DataFrame: Датафрейм с обработанными данными
+    """
+    city_df = pd.read_parquet(shards_path, filters=[("city", "==", city)])
+    # колонка раздела читается как категориальная, порядок файлов внутри раздела не гарантирован
+    city_df["city"] = city_df["city"].astype(str)
+    # в готовых шардах сезоны могут быть ещё не переведены
+    city_df["season"] = city_df["season"].replace(SEASON_NAMES)
+    city_df = city_df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+    return process_city(city_df)
+
+
+@sync_timeit
+def get_cities_data_distributed(
+    client: Client, cities: list[str], shards_path: str
+) -> tuple[dict[str, Future], dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    Обрабатывает шарды городов на воркерах Dask и считает там же статистики по годам и сезонам
+    и пороги аномалий по сезонам.
+    Обработанные датафреймы остаются на воркерах, пока на них есть ссылки из возвращённых Future
+
+    Args:
+        client (Client): Клиент Dask
+        cities (list[str]): Список городов
+        shards_path (str): Путь к каталогу шардов
+
+    Returns:
+        tuple[dict[str, Future], dict[str, pd.DataFrame], pd.DataFrame]: Словари город: Future
+            обработанного датафрейма и город: статистики, таблица порогов аномалий
+    """
+    processed = {
+        city: client.submit(process_city_shard, shards_path, city) for city in cities
+    }
+    stats = {
+        city: client.submit(get_year_stats, fut) for city, fut in processed.items()
+    }
+    thresholds = [
+        client.submit(get_season_thresholds_table, fut) for fut in processed.values()
+    ]
+
+    return (
+        processed,
+        client.gather(stats),  # type: ignore
+        pd.concat(client.gather(thresholds), ignore_index=True),  # type: ignore
+    )
+
+
 @sync_timeit
 def get_cities_data_sequential(
     cities: list[str], data: pd.DataFrame
@@ -72,8 +213,67 @@ def get_cities_data(cities: list[str], data: pd.DataFrame) -> dict[str, pd.DataF
         st.session_state.cities_data = cities_data
         st.session_state.seq_time = seq_time
         st.session_state.par_time = par_time
+        st.session_state.thresholds = get_season_thresholds_table(data)
 
     else:
         cities_data = st.session_state.cities_data
 
     return cities_data
+
+
+def get_cities_cluster(data: pd.DataFrame | None) -> list[str]:
+    """
+    Запускает обработку городов на кластере Dask и сохраняет результаты в сессии
+    Загруженные данные пишутся в каталог шардов, названный по хэшу их содержимого,
+    без загруженных данных используются готовые шарды из DASK_DATASET_PATH
+
+    Args:
+        data (pd.DataFrame | None): Исходный датафрейм с температурой или None
+
+    Returns:
+        list[str]: Список городов
+    """
+    if "cluster_data" not in st.session_state:
+        try:
+            client = get_dask_client(DASK_SCHEDULER_ADDRESS)  # type: ignore
+            if data is None:
+                shards_path = DASK_DATASET_PATH
+                cities = client.submit(get_shard_cities, shards_path).result()
+            else:
+                shards_path = get_shards_path(data)
+                write_city_shards(data, shards_path)
+                cities = data.city.unique().tolist()
+
+            (cluster_data, cluster_stats, thresholds), cluster_time = (
+                get_cities_data_distributed(client, cities, shards_path)
+            )
+        except (OSError, ImportError) as exc:
+            st.error(exc)
+            st.stop()
+
+        st.session_state.cluster_cities = cities
+        st.session_state.cluster_data = cluster_data
+        st.session_state.cluster_stats = cluster_stats
+        st.session_state.cluster_time = cluster_time
+        st.session_state.thresholds = thresholds
+
+    return st.session_state.cluster_cities
+
+
+def get_city_data_cluster(selected_city: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Получает статистики и обработанные данные выбранного города с кластера Dask
+
+    Args:
+        selected_city (str): Выбранный город
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: Статистики и обработанный датафрейм выбранного города
+    """
+    try:
+        city_df = st.session_state.cluster_data[selected_city].result()
+    except (OSError, ImportError) as exc:
+        st.error(exc)
+        st.stop()
+
+    return st.session_state.cluster_stats[selected_city], city_df
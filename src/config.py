@@ -1,9 +1,22 @@
+import os
+
 GEO_URL = (
     "http://api.openweathermap.org/geo/1.0/direct?q={city}&limit=5&appid={api_key}"
 )
 
 WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&exclude={part}&appid={api_key}&units={units}"
 
+# Адрес планировщика Dask; если задан, обработка городов выполняется на кластере
+DASK_SCHEDULER_ADDRESS = os.getenv("DASK_SCHEDULER_ADDRESS")
+
+# Каталог, в котором для каждой загрузки создаются шарды parquet, разбитые по городам.
+# Каталог должен быть доступен всем воркерам, а модули из src - импортируемы на них
+# (те же исходники в PYTHONPATH воркера), так как задачи ссылаются на analysis и benchmark.cpubound
+DASK_SHARDS_PATH = os.getenv("DASK_SHARDS_PATH", "data/shards")
+
+# Готовые шарды parquet, разбитые по городам (city=<город>/); если задан, загрузка CSV не нужна
+DASK_DATASET_PATH = os.getenv("DASK_DATASET_PATH")
+
 
 SEASON_COLORS = {
     "Зима": "blue",
@@ -19,6 +32,8 @@ SEASON_NAMES = {
     "autumn": "Осень",
 }
 
+RAW_COLUMNS = ["city", "timestamp", "temperature", "season"]
+
 COLUMN_NAMES = {
     "year": "Год",
     "season": "Сезон",
@@ -30,6 +45,10 @@ COLUMN_NAMES = {
     "city": "Город",
     "timestamp": "Дата",
     "temperature": "Температура, °C",
+    "lower": "Нижняя граница, °C",
+    "upper": "Верхняя граница, °C",
+    "deviation": "Отклонение, σ",
+    "is_anomaly": "Аномалия",
 }
 
 MONTH_TO_SEASON = {
@@ -5,12 +5,23 @@ import streamlit as st
 
 from analysis import (
     get_global_min_max,
-    get_season_thresholds,
     get_year_stats,
+    screen_current_temperatures,
+)
+from benchmark.cpubound import (
+    get_cities_cluster,
+    get_cities_data,
+    get_city_data_cluster,
 )
-from benchmark.cpubound import get_cities_data
 from benchmark.iobound import get_temperatures_table
-from config import COLUMN_NAMES, MONTH_TO_SEASON, SEASON_NAMES
+from config import (
+    COLUMN_NAMES,
+    DASK_DATASET_PATH,
+    DASK_SCHEDULER_ADDRESS,
+    MONTH_TO_SEASON,
+    RAW_COLUMNS,
+    SEASON_NAMES,
+)
 from plots import (
     get_common_temperature_figure,
     get_seasonal_temperature_figure,
@@ -68,33 +79,44 @@ def main():
         page_title="Weather Analysis", page_icon=":cloud:", layout="wide"
     )
     st.title("Анализ температурных данных")
-    st.subheader("Загрузка исторических данных")
-    uploaded_file = st.file_uploader(
-        "Выберите CSV файл с историческими температурными данными", type=["csv"]
-    )
-    if uploaded_file is None:
-        st.info("Пожалуйста, загрузите файл для продолжения.")
-        st.stop()
+    if DASK_SCHEDULER_ADDRESS and DASK_DATASET_PATH:
+        data = None
+    else:
+        st.subheader("Загрузка исторических данных")
+        uploaded_file = st.file_uploader(
+            "Выберите CSV файл с историческими температурными данными", type=["csv"]
+        )
+        if uploaded_file is None:
+            st.info("Пожалуйста, загрузите файл для продолжения.")
+            st.stop()
 
-    data = load_data(uploaded_file)
-    data["season"] = data["season"].map(SEASON_NAMES)
-    cities = data.city.unique()
+        data = load_data(uploaded_file)
+        data["season"] = data["season"].map(SEASON_NAMES)
 
     st.subheader("Анализ данных")
 
-    cities_data = get_cities_data(cities.tolist(), data)
-    st.write(f"Последовательная обработка заняла {st.session_state.seq_time} секунд")
-    st.write(f"Параллельная обработка заняла {st.session_state.par_time} секунд")
+    if DASK_SCHEDULER_ADDRESS:
+        cities = get_cities_cluster(data)
+        st.write(
+            f"Обработка на кластере Dask заняла {st.session_state.cluster_time} секунд"
+        )
+
+        selected_city = st.selectbox("Выберите город для анализа", cities)
+        stats_df, processed_data = get_city_data_cluster(selected_city)
+    else:
+        cities = data.city.unique().tolist()  # type: ignore
+        cities_data = get_cities_data(cities, data)  # type: ignore
+        st.write(
+            f"Последовательная обработка заняла {st.session_state.seq_time} секунд"
+        )
+        st.write(f"Параллельная обработка заняла {st.session_state.par_time} секунд")
 
-    selected_city = st.selectbox("Выберите город для анализа", cities)
-    processed_data = cities_data[selected_city]
+        selected_city = st.selectbox("Выберите город для анализа", cities)
+        processed_data = cities_data[selected_city]
+        stats_df = get_year_stats(processed_data)
 
     st.subheader("Просмотр данных")
-    st.dataframe(
-        data[data.city == selected_city].reset_index(drop=True), width="content"
-    )
-
-    stats_df = get_year_stats(processed_data)
+    st.dataframe(processed_data[RAW_COLUMNS].reset_index(drop=True), width="content")
 
     st.subheader("Описательная статистика")
     st.dataframe(stats_df.rename(columns=COLUMN_NAMES))
@@ -123,7 +145,7 @@ def main():
     if not owm_api_key:
         st.stop()
 
-    temperatures = get_temperatures_table(cities.tolist(), owm_api_key)
+    temperatures = get_temperatures_table(cities, owm_api_key)
 
     current_temperature = temperatures[selected_city]
     st.write(f"Синхронные запросы к API заняли {st.session_state.sync_time} секунд")
@@ -134,15 +156,27 @@ def main():
     )
 
     current_season = MONTH_TO_SEASON[datetime.now().month]
-    lower, upper = get_season_thresholds(processed_data, current_season)
-
-    show_final_message(
-        current_temperature,
-        lower,
-        upper,
-        current_season,
-        selected_city,
+    screening_df = screen_current_temperatures(
+        temperatures, st.session_state.thresholds, current_season
     )
+    selected_row = screening_df[screening_df["city"] == selected_city].iloc[0]
+
+    if pd.isna(selected_row["deviation"]):
+        st.info(
+            f"Недостаточно исторических данных, чтобы определить границы нормальной температуры "
+            f"для сезона **{current_season.lower()}** в городе **{selected_city}**"
+        )
+    else:
+        show_final_message(
+            current_temperature,
+            selected_row["lower"],
+            selected_row["upper"],
+            current_season,
+            selected_city,
+        )
+
+    st.subheader("Текущая температура во всех городах")
+    st.dataframe(screening_df.rename(columns=COLUMN_NAMES))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import (
+    get_season_thresholds,
+    get_season_thresholds_table,
+    screen_current_temperatures,
+)
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "city": ["Moscow"] * 4 + ["Cairo"] * 4 + ["Dubai"] * 2 + ["Oslo"],
+            "season": ["Зима", "Зима", "Лето", "Лето"] * 2 + ["Зима", "Зима", "Зима"],
+            "temperature": [-10.0, -6.0, 20.0, 24.0]
+            + [14.0, 18.0, 34.0, 38.0]
+            + [25.0, 25.0, 1.0],
+        }
+    )
+
+
+@pytest.fixture
+def thresholds(data) -> pd.DataFrame:
+    return get_season_thresholds_table(data)
+
+
+@pytest.mark.parametrize("city", ["Moscow", "Cairo"])
+@pytest.mark.parametrize("season", ["Зима", "Лето"])
+def test_thresholds_table_matches_single_city(data, thresholds, city, season):
+    row = thresholds[(thresholds.city == city) & (thresholds.season == season)]
+
+    lower, upper = get_season_thresholds(data[data.city == city], season)
+
+    assert row["lower"].item() == pytest.approx(lower)
+    assert row["upper"].item() == pytest.approx(upper)
+
+
+def test_screening_sorted_by_absolute_deviation(thresholds):
+    screening = screen_current_temperatures(
+        {"Moscow": -8.0, "Cairo": 30.0, "Dubai": 25.0}, thresholds, "Зима"
+    )
+
+    assert screening["city"].tolist()[:2] == ["Cairo", "Moscow"]
+    assert screening["deviation"].tolist()[:2] == pytest.approx([14 / np.sqrt(8), 0.0])
+
+
+def test_screening_anomaly_flag_at_boundaries(thresholds):
+    moscow = thresholds[(thresholds.city == "Moscow") & (thresholds.season == "Зима")]
+    lower, upper = moscow["lower"].item(), moscow["upper"].item()
+
+    def is_anomaly(temperature: float) -> bool:
+        screening = screen_current_temperatures(
+            {"Moscow": temperature}, thresholds, "Зима"
+        )
+        return bool(screening["is_anomaly"].item())
+
+    assert not is_anomaly(lower)
+    assert not is_anomaly(upper)
+    assert is_anomaly(np.nextafter(lower, -np.inf))
+    assert is_anomaly(np.nextafter(upper, np.inf))
+
+
+def test_screening_keeps_cities_without_thresholds(thresholds):
+    screening = screen_current_temperatures(
+        {"Moscow": 50.0, "Atlantis": 10.0, "Dubai": 30.0, "Oslo": 40.0},
+        thresholds,
+        "Зима",
+    )
+
+    assert screening["city"].tolist()[0] == "Moscow"
+    assert set(screening["city"]) == {"Moscow", "Atlantis", "Dubai", "Oslo"}
+    undefined = screening[screening["city"] != "Moscow"]
+    assert undefined["deviation"].isna().all()
+    assert not undefined["is_anomaly"].any()
+
+
+def test_screening_empty(thresholds):
+    screening = screen_current_temperatures({}, thresholds, "Зима")
+
+    assert screening.empty
+    assert {"city", "temperature", "deviation", "is_anomaly"} <= set(screening.columns)
@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from distributed import Client, LocalCluster
+
+from analysis import get_season_thresholds_table, get_year_stats
+from benchmark.cpubound import (
+    get_cities_data_distributed,
+    get_cities_data_sequential,
+    get_shard_cities,
+    get_shards_path,
+    process_city_shard,
+    write_city_shards,
+)
+from config import SEASON_NAMES
+
+DATA_PATH = Path(__file__).parents[1] / "data" / "temperature_data.csv"
+
+
+@pytest.fixture(scope="module")
+def data() -> pd.DataFrame:
+    df = pd.read_csv(DATA_PATH, parse_dates=["timestamp"])
+    df["season"] = df["season"].map(SEASON_NAMES)
+    return df
+
+
+@pytest.fixture(scope="module")
+def client():
+    with (
+        LocalCluster(n_workers=2, processes=False) as cluster,
+        Client(cluster) as client,
+    ):
+        yield client
+
+
+def test_get_shard_cities(data, tmp_path):
+    shards_path = str(tmp_path / "shards")
+    write_city_shards(data, shards_path)
+
+    assert get_shard_cities(shards_path) == sorted(data.city.unique())
+
+
+def test_distributed_matches_sequential(data, client, tmp_path):
+    shards_path = str(tmp_path / "shards")
+    write_city_shards(data, shards_path)
+    cities = data.city.unique().tolist()
+
+    expected, _ = get_cities_data_sequential(cities, data)
+    (processed, stats, thresholds), _ = get_cities_data_distributed(
+        client, cities, shards_path
+    )
+
+    assert set(stats) == set(cities)
+    for city in cities:
+        expected_df = expected[city].reset_index(drop=True)
+        city_df = processed[city].result()
+        pd.testing.assert_frame_equal(city_df, expected_df, check_like=True)
+        pd.testing.assert_frame_equal(stats[city], get_year_stats(expected_df))
+
+    pd.testing.assert_frame_equal(
+        thresholds.sort_values(["city", "season"]).reset_index(drop=True),
+        get_season_thresholds_table(data),
+    )
+
+
+def test_process_city_shard_translates_seasons(data, tmp_path):
+    shards_path = str(tmp_path / "shards")
+    raw = pd.read_csv(DATA_PATH, parse_dates=["timestamp"])
+    write_city_shards(raw, shards_path)
+
+    city_df = process_city_shard(shards_path, "Moscow")
+
+    assert set(city_df["season"]) == set(SEASON_NAMES.values())
+    assert len(city_df) == (data.city == "Moscow").sum()
+
+
+def test_shards_path_depends_on_content(data):
+    assert get_shards_path(data) == get_shards_path(data.copy())
+    changed = data.copy()
+    changed.loc[0, "temperature"] += 1
+    assert get_shards_path(changed) != get_shards_path(data)
+
+
+def test_write_city_shards_reuses_existing(data, tmp_path):
+    shards_path = str(tmp_path / "shards")
+    write_city_shards(data, shards_path)
+    write_city_shards(data[data.city == "Moscow"], shards_path)
+
+    assert get_shard_cities(shards_path) == sorted(data.city.unique())
+    assert [p.name for p in tmp_path.iterdir()] == ["shards"]